@@ -20,6 +20,8 @@ class DungeonConfig:
     # multi-floor: which floor this grid is (0-based) and how many the dungeon has
     floor: int = 0
     num_floors: int = 1
+    # record per-phase generation wall time (ms) in metrics["phase_ms"]
+    time_phases: bool = False
     # legacy knobs (pre rooms-and-mazes generator); accepted but unused
     irregular_chance: float = 0.0
     blob_room_chance: float = 0.0
@@ -17,16 +17,22 @@ region remains, and dead-end culling only ever removes degree-1 cells.
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from heapq import heapify, heappop, heappush
+from typing import List, Tuple
 
 from .tiles import CAVE, DOOR, ROOM, TUNNEL, WALL
 
 Point = Tuple[int, int]
 _DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
-
-
-def _ortho(x: int, y: int):
-    return ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))
+# Tile classes as frozensets: one hash probe per test instead of a tuple scan
+# (most probes are CAVE, which misses every element of a tuple).
+_REGION_TILES = frozenset((ROOM, TUNNEL))
+_PASSABLE = frozenset((ROOM, TUNNEL, DOOR))
+_REGION_LUT = bytes(1 if chr(i) in _REGION_TILES else 0 for i in range(256))
+# bytes.translate tables mapping a tile code point to b"1" (in class) or b"0",
+# turning an encoded column into a binary literal for int(..., 2).
+_ROOM_BITS = bytes(0x31 if chr(i) == ROOM else 0x30 for i in range(256))
+_CAVE_BITS = bytes(0x31 if chr(i) == CAVE else 0x30 for i in range(256))
 
 
 def fill_maze(grid, rng, straight_max: int = 10) -> None:
@@ -46,17 +52,27 @@ def _run_behind(grid, x: int, y: int, d: Tuple[int, int]) -> int:
     """Length of the existing straight TUNNEL run ending at (x, y) along axis d
     (looking backwards). Measured from the grid, not the carve path, so
     backtracked re-extensions can't sneak past the straight cap."""
+    dx, dy = d
     n = 0
-    while grid[x][y] == TUNNEL:
+    if not dx:  # vertical run: stay inside one column list
+        col, h = grid[x], len(grid[0])
+        while 0 <= y < h and col[y] == TUNNEL:
+            n += 1
+            y -= dy
+        return n
+    w = len(grid)
+    while 0 <= x < w and grid[x][y] == TUNNEL:
         n += 1
-        x, y = x - d[0], y - d[1]
-        if not (0 <= x < len(grid) and 0 <= y < len(grid[0])):
-            break
+        x -= dx
     return n
 
 
 def _grow_maze(grid, sx: int, sy: int, rng, straight_max: int) -> None:
     w, h = len(grid), len(grid[0])
+    # Bound methods looked up once; draws stay one-per-step in the same order
+    # (pre-drawing a batch would shift the stream and change every seed).
+    random, choice = rng.random, rng.choice
+    run_cap = straight_max - 2
     grid[sx][sy] = TUNNEL
     # stack entries: (x, y, dir_in)
     stack: List[Tuple[int, int, Tuple[int, int] | None]] = [(sx, sy, None)]
@@ -64,63 +80,96 @@ def _grow_maze(grid, sx: int, sy: int, rng, straight_max: int) -> None:
         x, y, dir_in = stack[-1]
         options = []
         for d in _DIRS:
-            nx, ny = x + 2 * d[0], y + 2 * d[1]
-            if (
-                1 <= nx < w - 1
-                and 1 <= ny < h - 1
-                and grid[nx][ny] == CAVE
-                and _run_behind(grid, x, y, d) + 2 <= straight_max
-            ):
+            dx, dy = d
+            nx, ny = x + 2 * dx, y + 2 * dy
+            if 1 <= nx < w - 1 and 1 <= ny < h - 1 and grid[nx][ny] == CAVE and _run_behind(grid, x, y, d) <= run_cap:
                 options.append(d)
         if not options:
             stack.pop()
             continue
-        if dir_in in options and rng.random() < 0.35:
+        if dir_in in options and random() < 0.35:
             d = dir_in  # mild straight bias; capped above
         else:
-            d = rng.choice(options)
-        grid[x + d[0]][y + d[1]] = TUNNEL
-        grid[x + 2 * d[0]][y + 2 * d[1]] = TUNNEL
-        stack.append((x + 2 * d[0], y + 2 * d[1], d))
+            d = choice(options)
+        dx, dy = d
+        grid[x + dx][y + dy] = TUNNEL
+        nx, ny = x + 2 * dx, y + 2 * dy
+        grid[nx][ny] = TUNNEL
+        stack.append((nx, ny, d))
+
+
+def _label_regions(grid) -> Tuple[List[int], int]:
+    """Flood-fill contiguous walkable (ROOM/TUNNEL) areas into region ids.
 
+    Returns (labels, count): labels is a flat list indexed by x * h + y
+    holding the region id of each cell, or -1 outside every region.
 
-def _label_regions(grid) -> Dict[Point, int]:
-    """Flood-fill contiguous walkable (ROOM/TUNNEL) areas into region ids."""
+    Region cells are first marked in a flat bytearray through a 256-byte
+    lookup table (bytes.translate per column). Each flood clears what it
+    labels, so the next region's seed is just the next set byte, found in C
+    with bytearray.find rather than by testing every cell in Python.
+    """
     w, h = len(grid), len(grid[0])
-    region: Dict[Point, int] = {}
+    unlabelled = bytearray(b"".join("".join(col).encode("latin-1").translate(_REGION_LUT) for col in grid))
+    labels = [-1] * (w * h)
     rid = 0
-    for x in range(w):
-        for y in range(h):
-            if grid[x][y] not in (ROOM, TUNNEL) or (x, y) in region:
-                continue
-            stack = [(x, y)]
-            region[(x, y)] = rid
-            while stack:
-                cx, cy = stack.pop()
-                for nx, ny in _ortho(cx, cy):
-                    if 0 <= nx < w and 0 <= ny < h and grid[nx][ny] in (ROOM, TUNNEL) and (nx, ny) not in region:
-                        region[(nx, ny)] = rid
-                        stack.append((nx, ny))
-            rid += 1
-    return region
-
-
-def _straight_through(grid, x: int, y: int) -> int:
+    seed = unlabelled.find(1)
+    while seed != -1:
+        unlabelled[seed] = 0
+        labels[seed] = rid
+        stack = [seed]
+        while stack:
+            cx, cy = divmod(stack.pop(), h)
+            for dx, dy in _DIRS:
+                nx, ny = cx + dx, cy + dy
+                if 0 <= nx < w and 0 <= ny < h and unlabelled[nx * h + ny]:
+                    j = nx * h + ny
+                    unlabelled[j] = 0
+                    labels[j] = rid
+                    stack.append(j)
+        rid += 1
+        seed = unlabelled.find(1, seed + 1)
+    return labels, rid
+
+
+def _adjacent(grid, x: int, y: int, tile: str) -> int:
+    """Number of orthogonal neighbours of (x, y) holding `tile`."""
+    w, h = len(grid), len(grid[0])
+    n = 0
+    for dx, dy in _DIRS:
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < w and 0 <= ny < h and grid[nx][ny] == tile:
+            n += 1
+    return n
+
+
+def _straight_through(grid, x: int, y: int, cap: int) -> int:
     """Longest straight TUNNEL run that would pass through (x, y) if it were
-    carved as TUNNEL."""
+    carved as TUNNEL, counted no further than `cap` (callers only compare
+    against the straight limit, so longer corridors needn't be walked)."""
     w, h = len(grid), len(grid[0])
-    best = 0
-    for dx, dy in ((1, 0), (0, 1)):
-        n = 1
-        for s in (1, -1):
-            k = 1
-            while (
-                0 <= x + s * k * dx < w and 0 <= y + s * k * dy < h and grid[x + s * k * dx][y + s * k * dy] == TUNNEL
-            ):
-                n += 1
-                k += 1
-        best = max(best, n)
-    return best
+    col = grid[x]
+    vert = 1  # walk the column list directly
+    k = y + 1
+    while vert < cap and k < h and col[k] == TUNNEL:
+        vert += 1
+        k += 1
+    k = y - 1
+    while vert < cap and k >= 0 and col[k] == TUNNEL:
+        vert += 1
+        k -= 1
+    if vert >= cap:
+        return cap
+    horiz = 1
+    k = x + 1
+    while horiz < cap and k < w and grid[k][y] == TUNNEL:
+        horiz += 1
+        k += 1
+    k = x - 1
+    while horiz < cap and k >= 0 and grid[k][y] == TUNNEL:
+        horiz += 1
+        k -= 1
+    return max(vert, horiz)
 
 
 def connect_regions(grid, rng, loop_chance: float = 0.04, straight_max: int = 10) -> None:
@@ -136,22 +185,28 @@ def connect_regions(grid, rng, loop_chance: float = 0.04, straight_max: int = 10
     other connector merges their regions (connectivity beats aesthetics).
     """
     w, h = len(grid), len(grid[0])
-    region = _label_regions(grid)
-    if not region:
+    region, n_regions = _label_regions(grid)
+    if not n_regions:
         return
+    # Each connector carries its ROOM-neighbour count: connecting only turns
+    # CAVE into DOOR/TUNNEL, so the count taken here holds for the whole pass.
     connectors = []
     for x in range(1, w - 1):
+        left, col, right = grid[x - 1], grid[x], grid[x + 1]
         for y in range(1, h - 1):
-            if grid[x][y] != CAVE:
+            if col[y] != CAVE:
                 continue
-            for (ax, ay), (bx, by) in (((x - 1, y), (x + 1, y)), ((x, y - 1), (x, y + 1))):
-                ra, rb = region.get((ax, ay)), region.get((bx, by))
-                if ra is not None and rb is not None and ra != rb:
-                    connectors.append((x, y, ra, rb))
+            i = x * h + y
+            for a, b in ((i - h, i + h), (i - 1, i + 1)):
+                ra, rb = region[a], region[b]
+                if ra >= 0 and rb >= 0 and ra != rb:
+                    rooms = (left[y] == ROOM) + (right[y] == ROOM) + (col[y - 1] == ROOM) + (col[y + 1] == ROOM)
+                    connectors.append((x, y, ra, rb, rooms))
                     break
     rng.shuffle(connectors)
 
-    parent = list(range(max(region.values()) + 1))
+    parent = list(range(n_regions))
+    rank = [0] * len(parent)
 
     def find(i: int) -> int:
         while parent[i] != i:
@@ -159,37 +214,52 @@ def connect_regions(grid, rng, loop_chance: float = 0.04, straight_max: int = 10
             i = parent[i]
         return i
 
-    def would_be_door(x: int, y: int) -> bool:
-        room_adj = sum(1 for nx, ny in _ortho(x, y) if 0 <= nx < w and 0 <= ny < h and grid[nx][ny] == ROOM)
-        return room_adj == 1
+    def union(fa: int, fb: int) -> None:
+        # Union by rank on top of path halving; only root equality is ever
+        # observed, so which root survives doesn't affect the carved map.
+        if rank[fa] < rank[fb]:
+            fa, fb = fb, fa
+        parent[fb] = fa
+        if rank[fa] == rank[fb]:
+            rank[fa] += 1
 
+    run_cap = straight_max + 1  # enough to tell "too long" from "fits"
     deferred = []
-    for x, y, ra, rb in connectors:
+    for x, y, ra, rb, rooms in connectors:
         fa, fb = find(ra), find(rb)
+        would_be_door = rooms == 1
         if fa == fb:
-            if rng.random() < loop_chance and (would_be_door(x, y) or _straight_through(grid, x, y) <= straight_max):
-                _open_connector(grid, x, y)
+            if rng.random() < loop_chance and (would_be_door or _straight_through(grid, x, y, run_cap) <= straight_max):
+                _open_connector(grid, x, y, rooms)
             continue
-        if not would_be_door(x, y) and _straight_through(grid, x, y) > straight_max:
-            deferred.append((x, y, ra, rb))
+        if not would_be_door and _straight_through(grid, x, y, run_cap) > straight_max:
+            deferred.append((x, y, ra, rb, rooms))
             continue
-        _open_connector(grid, x, y)
-        parent[fa] = fb
-    for x, y, ra, rb in deferred:
+        _open_connector(grid, x, y, rooms)
+        union(fa, fb)
+    for x, y, ra, rb, rooms in deferred:
         fa, fb = find(ra), find(rb)
         if fa != fb:
-            _open_connector(grid, x, y)
-            parent[fa] = fb
+            _open_connector(grid, x, y, rooms)
+            union(fa, fb)
 
 
-def _open_connector(grid, x: int, y: int) -> None:
-    w, h = len(grid), len(grid[0])
-    room_adj = sum(1 for nx, ny in _ortho(x, y) if 0 <= nx < w and 0 <= ny < h and grid[nx][ny] == ROOM)
-    door_adj = any(0 <= nx < w and 0 <= ny < h and grid[nx][ny] == DOOR for nx, ny in _ortho(x, y))
-    # DOOR only for a clean room<->corridor junction; room<->room and
-    # corridor<->corridor openings stay TUNNEL, as does anything that would
-    # violate the no-adjacent-doors invariant.
-    grid[x][y] = DOOR if room_adj == 1 and not door_adj else TUNNEL
+def _open_connector(grid, x: int, y: int, rooms: int) -> None:
+    # DOOR only for a clean room<->corridor junction (`rooms` is the number
+    # of ROOM neighbours); room<->room and corridor<->corridor openings stay
+    # TUNNEL, as does anything that would violate the no-adjacent-doors
+    # invariant.
+    door = rooms == 1 and not _adjacent(grid, x, y, DOOR)
+    grid[x][y] = DOOR if door else TUNNEL
+
+
+def _dead_end(left, col, right, y: int) -> bool:
+    """True if TUNNEL cell col[y] has at most one passable neighbour and no
+    DOOR neighbour (left/right are the adjacent column lists)."""
+    a, b, c, d = left[y], right[y], col[y - 1], col[y + 1]
+    if a == DOOR or b == DOOR or c == DOOR or d == DOOR:
+        return False
+    return (a in _PASSABLE) + (b in _PASSABLE) + (c in _PASSABLE) + (d in _PASSABLE) <= 1
 
 
 def cull_dead_ends(grid, rng, keep_chance: float = 0.2) -> None:
@@ -198,46 +268,85 @@ def cull_dead_ends(grid, rng, keep_chance: float = 0.2) -> None:
     Only TUNNEL cells with at most one walkable neighbor are removed, so
     connectivity of everything else is preserved. Cells adjacent to a DOOR are
     never removed (a door must keep its corridor approach).
+
+    Semantically this sweeps the grid in (x, y) order until a sweep removes
+    nothing. Only the first sweep actually scans every cell: afterwards the
+    only cells that can have become dead ends are neighbours of a removal, so
+    those are queued (by packed index x * h + y, popped in ascending order)
+    and replayed in exactly the order the full sweeps would reach them. RNG
+    draws, and so the result, match re-scanning the whole grid.
     """
     w, h = len(grid), len(grid[0])
-    walkable = (ROOM, TUNNEL, DOOR)
-    protected = set()
-    changed = True
-    while changed:
-        changed = False
-        for x in range(1, w - 1):
-            for y in range(1, h - 1):
-                if grid[x][y] != TUNNEL or (x, y) in protected:
-                    continue
-                deg = 0
-                door_adj = False
-                for nx, ny in _ortho(x, y):
-                    t = grid[nx][ny]
-                    if t in walkable:
-                        deg += 1
-                    if t == DOOR:
-                        door_adj = True
-                if deg > 1 or door_adj:
-                    continue
-                if rng.random() < keep_chance:
-                    protected.add((x, y))
-                else:
-                    grid[x][y] = CAVE
-                    changed = True
+    random = rng.random
+    protected = bytearray(w * h)  # flat x * h + y flags for kept dead ends
+    behind: List[int] = []  # already passed in this sweep: recheck next sweep
+    for x in range(1, w - 1):
+        # Writes go to `col` in place, so later cells of this column see them.
+        left, col, right = grid[x - 1], grid[x], grid[x + 1]
+        for y in range(1, h - 1):
+            if col[y] != TUNNEL or protected[x * h + y] or not _dead_end(left, col, right, y):
+                continue
+            if random() < keep_chance:
+                protected[x * h + y] = 1
+            else:
+                col[y] = CAVE
+                # (x+1, y) and (x, y+1) are still ahead in this sweep.
+                behind.append((x - 1) * h + y)
+                behind.append(x * h + y - 1)
+    while behind:
+        ahead = behind
+        heapify(ahead)
+        behind = []
+        last = -1
+        while ahead:
+            i = heappop(ahead)
+            if i == last:
+                continue
+            last = i
+            x, y = divmod(i, h)
+            if not (0 < x < w - 1 and 0 < y < h - 1):
+                continue
+            col = grid[x]
+            if col[y] != TUNNEL or protected[i] or not _dead_end(grid[x - 1], col, grid[x + 1], y):
+                continue
+            if random() < keep_chance:
+                protected[i] = 1
+            else:
+                col[y] = CAVE
+                heappush(ahead, i + h)
+                heappush(ahead, i + 1)
+                behind.append(i - h)
+                behind.append(i - 1)
+
+
+def _column_bits(col, lut: bytes) -> int:
+    """Column as an int bit row: bit y set where lut maps col[y] to b"1"."""
+    return int("".join(col).encode("latin-1")[::-1].translate(lut), 2)
 
 
 def derive_walls(grid) -> None:
     """Convert each CAVE cell orthogonally adjacent to a ROOM into a WALL.
-    Tunnels remain bare corridors through solid CAVE; doors are untouched."""
+    Tunnels remain bare corridors through solid CAVE; doors are untouched.
+
+    Works on bit rows: each column becomes an int with one bit per cell, so
+    "has a ROOM neighbour" for a whole column is two shifts and two ORs, and
+    only the resulting wall bits are visited in Python.
+    """
     w, h = len(grid), len(grid[0])
-    to_wall = []
+    rooms = [_column_bits(col, _ROOM_BITS) for col in grid]
+    caves = [_column_bits(col, _CAVE_BITS) for col in grid]
+    full = (1 << h) - 1
     for x in range(w):
-        for y in range(h):
-            if grid[x][y] != CAVE:
-                continue
-            for nx, ny in _ortho(x, y):
-                if 0 <= nx < w and 0 <= ny < h and grid[nx][ny] == ROOM:
-                    to_wall.append((x, y))
-                    break
-    for x, y in to_wall:
-        grid[x][y] = WALL
+        r = rooms[x]
+        adj = (r << 1 | r >> 1) & full
+        if x > 0:
+            adj |= rooms[x - 1]
+        if x < w - 1:
+            adj |= rooms[x + 1]
+        walls = adj & caves[x]
+        # Masks were taken up front, so these writes can't feed back into them.
+        col = grid[x]
+        while walls:
+            low = walls & -walls
+            col[low.bit_length() - 1] = WALL
+            walls ^= low
@@ -22,28 +22,44 @@ Public contract (consumed across app/):
     Dungeon(seed=None, size=(W,H,1)) | Dungeon(DungeonConfig(...))
     .grid[x][y] (column-major), .rooms, .room_types, .metrics, .seed, .size,
     .config, .stairs_up, .stairs_down, .entry_point, .loot_room_doors, .portal
-    .is_walkable(x,y,unlocked_doors=None), .reveal_secret_door(x,y),
-    .to_json(), .to_ascii()
+    .is_walkable(x,y,unlocked_doors=None), .walkable_mask(), .cells_of(kinds),
+    .is_connected(a,b), .reveal_secret_door(x,y), .to_json(), .to_ascii()
     Tiles: C R W T D S L P < >
 """
 
 from __future__ import annotations
 
 import random
-from collections import deque
+from collections import Counter
+from time import perf_counter
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from . import connect as connect_mod
 from .config import DungeonConfig
 from .rooms import Room, place_rooms
-from .tiles import CAVE, DOOR, ROOM, STAIRS_DOWN, STAIRS_UP, TELEPORT, TUNNEL, WALL
-
-SECRET_DOOR = "S"
-LOCKED_DOOR = "L"
-
-_WALKABLE = {ROOM, TUNNEL, DOOR, TELEPORT, STAIRS_UP, STAIRS_DOWN}
+from .tiles import (
+    CAVE,
+    DOOR,
+    LOCKED_DOOR,
+    ROOM,
+    SECRET_DOOR,
+    STAIRS_DOWN,
+    STAIRS_UP,
+    TELEPORT,
+    TUNNEL,
+    WALL,
+)
+
+_WALKABLE = frozenset((ROOM, TUNNEL, DOOR, TELEPORT, STAIRS_UP, STAIRS_DOWN))
 # Locked doors are logically passable (a key exists), so they count for connectivity.
 _CONNECTED = _WALKABLE | {LOCKED_DOOR}
+# Anything that opens a room to the outside (loot-room sealing).
+_OPENINGS = frozenset((DOOR, TUNNEL, SECRET_DOOR, LOCKED_DOOR))
+_DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+# 256-entry byte lookups: tile code point -> 1 if in the class. bytes.translate
+# applies one to a whole encoded column in C.
+_WALKABLE_LUT = bytes(1 if chr(i) in _WALKABLE else 0 for i in range(256))
+_CONNECTED_LUT = bytes(1 if chr(i) in _CONNECTED else 0 for i in range(256))
 
 
 def floor_seed(base_seed: int, z: int) -> int:
@@ -55,6 +71,101 @@ def floor_seed(base_seed: int, z: int) -> int:
     return (base_seed ^ (z * 0x9E3779B1)) & 0x7FFFFFFF
 
 
+def _open_cells(grid, lut: bytes) -> bytearray:
+    """Flat x * h + y bitmap of the grid, 1 where lut admits the tile."""
+    return bytearray(b"".join("".join(col).encode("latin-1").translate(lut) for col in grid))
+
+
+def _flood_rooms(grid, room_id, rooms, start: Tuple[int, int], blocked) -> List[bool]:
+    """Flood from `start` over connected tiles, never entering `blocked`
+    cells, and flag each room index the flood reaches (room 0 is the start
+    room). Stops as soon as every room is flagged.
+
+    Shared by the connectivity check and the unreachable-room metric. Cells
+    are packed as x * h + y into one flat bytearray that is 1 while a cell is
+    still enterable (connected tile, not blocked, not yet visited), built
+    by _open_cells through _CONNECTED_LUT. The queue is a plain list
+    consumed by a running iterator (append-only, no per-node tuples).
+
+    A room interior is one open rectangle, so the first time the flood
+    touches a room the whole rectangle is closed off by column slices and
+    only its outline cells are queued: interior cells have nowhere new to
+    lead, and skipping them avoids walking every room tile one at a time.
+    """
+    w, h = len(grid), len(grid[0])
+    n_rooms = len(rooms)
+    reached = [False] * n_rooms
+    remaining = n_rooms
+    free = _open_cells(grid, _CONNECTED_LUT)
+    for bx, by in blocked:
+        free[bx * h + by] = 0
+    queue: List[int] = []
+
+    def enter_room(rid: int) -> None:
+        r = rooms[rid]
+        lo, hi = r.y, r.y + r.h
+        for x in range(r.x, r.x + r.w):
+            base = x * h
+            free[base + lo : base + hi] = bytes(r.h)
+            if x == r.x or x == r.x + r.w - 1:
+                queue.extend(range(base + lo, base + hi))
+            else:
+                queue.append(base + lo)
+                queue.append(base + hi - 1)
+
+    first = start[0] * h + start[1]
+    free[first] = 0
+    queue.append(first)
+    if room_id[first] >= 0:
+        reached[room_id[first]] = True
+        remaining -= 1
+        enter_room(room_id[first])
+    if not remaining:
+        return reached
+    for i in queue:  # iterating a list while appending to it is a FIFO walk
+        x, y = divmod(i, h)
+        for dx, dy in _DIRS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < w and 0 <= ny < h and free[nx * h + ny]:
+                j = nx * h + ny
+                free[j] = 0
+                rid = room_id[j]
+                if rid < 0:
+                    queue.append(j)
+                elif not reached[rid]:
+                    reached[rid] = True
+                    remaining -= 1
+                    if not remaining:
+                        return reached
+                    enter_room(rid)
+    return reached
+
+
+class _PhaseTimer:
+    """`with timer("name"):` stores the block's wall time in ms under `name`
+    in `sink`. With sink None it does nothing, so untimed generation pays
+    only the with-statement itself. Phases are flat; not re-entrant."""
+
+    __slots__ = ("sink", "name", "t0")
+
+    def __init__(self, sink: Optional[Dict[str, float]]):
+        self.sink = sink
+        self.name = ""
+        self.t0 = 0.0
+
+    def __call__(self, name: str) -> "_PhaseTimer":
+        self.name = name
+        return self
+
+    def __enter__(self) -> None:
+        if self.sink is not None:
+            self.t0 = perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        if self.sink is not None:
+            self.sink[self.name] = round((perf_counter() - self.t0) * 1000.0, 3)
+
+
 class Dungeon:
     def __init__(
         self,
@@ -86,7 +197,8 @@ class Dungeon:
         self._rng = random.Random(floor_seed(self.config.seed, self.config.floor))
         self.seed = self.config.seed
         self.size = (self.config.width, self.config.height, self.config.num_floors)
-        self.grid: List[List[str]] = [[CAVE for _ in range(self.config.height)] for _ in range(self.config.width)]
+        # One contiguous list per column, filled at C level (list repetition).
+        self.grid: List[List[str]] = [[CAVE] * self.config.height for _ in range(self.config.width)]
         self.rooms: List[Room] = []
         self.room_types: List[str] = []
         self.metrics: Dict[str, Any] = {}
@@ -94,6 +206,8 @@ class Dungeon:
         self.stairs_down: Optional[Tuple[int, int]] = None
         self.portal: Optional[Tuple[int, int]] = None
         self.loot_room_doors: Set[Tuple[int, int]] = set()
+        # room index per cell, flat x * h + y like the flood bitmaps; -1 outside rooms
+        self._room_id: List[int] = []
         self._generate()
 
     @property
@@ -110,18 +224,30 @@ class Dungeon:
 
     # ------------------------------------------------------------------
     def _generate(self):
-        self._place_rooms()
-        connect_mod.fill_maze(self.grid, self._rng, self.config.straight_max)
-        connect_mod.connect_regions(self.grid, self._rng, self.config.extra_connection_chance, self.config.straight_max)
-        connect_mod.cull_dead_ends(self.grid, self._rng, self.config.dead_end_keep)
-        connect_mod.derive_walls(self.grid)
-        self._assign_room_types()
-        self._place_stairs()
-        self._augment_doors_with_variants()
-        if self.is_deepest:
-            self._seal_loot_room()
-        self._compute_connectivity_metrics()
-        self._collect_counts()
+        cfg = self.config
+        phase_ms: Optional[Dict[str, float]] = {} if cfg.time_phases else None
+        phase = _PhaseTimer(phase_ms)
+        with phase("rooms"):
+            self._place_rooms()
+        with phase("maze"):
+            connect_mod.fill_maze(self.grid, self._rng, cfg.straight_max)
+        with phase("connect"):
+            connect_mod.connect_regions(self.grid, self._rng, cfg.extra_connection_chance, cfg.straight_max)
+        with phase("cull"):
+            connect_mod.cull_dead_ends(self.grid, self._rng, cfg.dead_end_keep)
+        with phase("walls"):
+            connect_mod.derive_walls(self.grid)
+        with phase("features"):
+            self._assign_room_types()
+            self._place_stairs()
+            self._augment_doors_with_variants()
+            if self.is_deepest:
+                self._seal_loot_room()
+        with phase("metrics"):
+            self._compute_connectivity_metrics()
+            self._collect_counts()
+        if phase_ms is not None:
+            self.metrics["phase_ms"] = phase_ms
         # Teleports retired: expose empty structures for backward-compatible consumers.
         self.metrics["teleport_pairs"] = []
         self.metrics["teleport_lookup"] = {}
@@ -130,6 +256,11 @@ class Dungeon:
     def _place_rooms(self):
         rooms, target, placed = place_rooms(self.grid, self.config, rng=self._rng)
         self.rooms = rooms
+        h = self.config.height
+        self._room_id = room_id = [-1] * (self.config.width * h)
+        for i, r in enumerate(rooms):
+            for x in range(r.x, r.x + r.w):
+                room_id[x * h + r.y : x * h + r.y + r.h] = [i] * r.h
         self.metrics["rooms_attempted"] = target
         self.metrics["rooms_placed"] = placed
 
@@ -149,23 +280,39 @@ class Dungeon:
             if len(candidates) > 1:
                 self.room_types[candidates[1]] = "treasure"
         # connector/deadend by door count (skip special rooms)
-        for idx, r in enumerate(self.rooms):
+        door_counts = self._door_counts()
+        for idx, dc in enumerate(door_counts):
             if self.room_types[idx] in ("start", "boss", "treasure"):
                 continue
-            dc = len(self._room_doors(r))
             if dc <= 1:
                 self.room_types[idx] = "deadend"
             elif dc >= 3:
                 self.room_types[idx] = "connector"
 
-    def _room_doors(self, r: Room, kinds=(DOOR,)) -> List[Tuple[int, int]]:
+    def _door_counts(self) -> List[int]:
+        """DOOR tiles touching each room, for every room in one sweep. Doors
+        are located per column with str.find and attributed to the rooms
+        orthogonally next to them via the room-id plane."""
+        counts = [0] * len(self.rooms)
+        room_id = self._room_id
+        w, h = self.config.width, self.config.height
+        for x, col in enumerate(self.grid):
+            line = "".join(col)
+            y = line.find(DOOR)
+            while y != -1:
+                for dx, dy in _DIRS:
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < w and 0 <= ny < h and room_id[nx * h + ny] >= 0:
+                        counts[room_id[nx * h + ny]] += 1
+                y = line.find(DOOR, y + 1)
+        return counts
+
+    def _room_doors(self, r: Room, kinds=frozenset((DOOR,))) -> List[Tuple[int, int]]:
+        # Only the outline can touch the room from outside; interior cells are
+        # room tiles (or stairs/portal), never doors or tunnels.
+        grid = self.grid
         w, h = self.config.width, self.config.height
-        seen = set()
-        for x, y in r.cells():
-            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
-                if 0 <= nx < w and 0 <= ny < h and self.grid[nx][ny] in kinds:
-                    seen.add((nx, ny))
-        return sorted(seen)
+        return sorted((x, y) for x, y in r.ring() if 0 <= x < w and 0 <= y < h and grid[x][y] in kinds)
 
     # ---------------- Stairs ----------------
     def _place_stairs(self):
@@ -175,21 +322,22 @@ class Dungeon:
             return
         special = {i for i, t in enumerate(self.room_types) if t in ("boss", "treasure")}
         candidates = [i for i in range(len(self.rooms)) if i not in special] or list(range(len(self.rooms)))
+        centers = [r.center for r in self.rooms]
 
         def far_from(pt: Tuple[int, int]) -> int:
-            return max(
-                candidates, key=lambda i: abs(self.rooms[i].center[0] - pt[0]) + abs(self.rooms[i].center[1] - pt[1])
-            )
+            px, py = pt
+            dist = [abs(centers[i][0] - px) + abs(centers[i][1] - py) for i in candidates]
+            return candidates[dist.index(max(dist))]
 
         if self.config.floor > 0:
             up_idx = self._rng.choice(candidates)
-            self.stairs_up = self.rooms[up_idx].center
+            self.stairs_up = centers[up_idx]
             x, y = self.stairs_up
             self.grid[x][y] = STAIRS_UP
         if not self.is_deepest:
-            anchor = self.stairs_up or self.rooms[0].center
+            anchor = self.stairs_up or centers[0]
             down_idx = far_from(anchor)
-            cx, cy = self.rooms[down_idx].center
+            cx, cy = centers[down_idx]
             if (cx, cy) == self.stairs_up:
                 cx += 1  # tiny floor with one candidate room: nudge off the up-stairs
             self.stairs_down = (cx, cy)
@@ -230,26 +378,28 @@ class Dungeon:
         idx = next((i for i, t in enumerate(self.room_types) if t == "treasure"), None)
         if idx is None:
             return
+        grid = self.grid
         room = self.rooms[idx]
-        openings = self._room_doors(room, kinds=(DOOR, TUNNEL, SECRET_DOOR, LOCKED_DOOR))
+        openings = self._room_doors(room, kinds=_OPENINGS)
         for x, y in openings:
-            self.grid[x][y] = LOCKED_DOOR
+            grid[x][y] = LOCKED_DOOR
         # No-adjacent-door-variants invariant: two openings can touch when a
         # corridor corner hugs the room. Wall one of each adjacent pair off,
         # but only when the rest of the dungeon stays fully connected.
         opening_set = set(openings)
         for x, y in list(opening_set):
-            if self.grid[x][y] != LOCKED_DOOR:
+            if grid[x][y] != LOCKED_DOOR:
                 continue
-            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
-                if (nx, ny) in opening_set and self.grid[nx][ny] == LOCKED_DOOR:
+            for dx, dy in _DIRS:
+                nx, ny = x + dx, y + dy
+                if (nx, ny) in opening_set and grid[nx][ny] == LOCKED_DOOR:
                     if self._keeps_connectivity({(x, y)}):
-                        self.grid[x][y] = WALL
+                        grid[x][y] = WALL
                         opening_set.discard((x, y))
                         break
-        self.loot_room_doors = {(x, y) for x, y in opening_set if self.grid[x][y] == LOCKED_DOOR}
+        self.loot_room_doors = {(x, y) for x, y in opening_set if grid[x][y] == LOCKED_DOOR}
         cx, cy = room.center
-        self.grid[cx][cy] = TELEPORT
+        grid[cx][cy] = TELEPORT
         self.portal = (cx, cy)
 
     def _keeps_connectivity(self, blocked: set) -> bool:
@@ -257,23 +407,7 @@ class Dungeon:
         given cells are treated as non-walkable."""
         if not self.rooms:
             return True
-        w, h = self.config.width, self.config.height
-        start = self.rooms[0].center
-        q = deque([start])
-        seen = {start}
-        while q:
-            x, y = q.popleft()
-            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
-                if (
-                    0 <= nx < w
-                    and 0 <= ny < h
-                    and (nx, ny) not in seen
-                    and (nx, ny) not in blocked
-                    and self.grid[nx][ny] in _CONNECTED
-                ):
-                    seen.add((nx, ny))
-                    q.append((nx, ny))
-        return all(any((ix, iy) in seen for ix, iy in r.cells()) for r in self.rooms)
+        return all(_flood_rooms(self.grid, self._room_id, self.rooms, self.rooms[0].center, blocked))
 
     def reveal_secret_door(self, x: int, y: int) -> bool:
         if 0 <= x < self.config.width and 0 <= y < self.config.height and self.grid[x][y] == SECRET_DOOR:
@@ -285,37 +419,65 @@ class Dungeon:
         if not (0 <= x < self.config.width and 0 <= y < self.config.height):
             return False
         cell = self.grid[x][y]
-        if cell == LOCKED_DOOR:
-            return unlocked_doors is not None and (x, y) in unlocked_doors
-        return cell in _WALKABLE  # secret doors not walkable until revealed
+        if cell in _WALKABLE:  # secret doors not walkable until revealed
+            return True
+        return cell == LOCKED_DOOR and unlocked_doors is not None and (x, y) in unlocked_doors
+
+    def walkable_mask(self) -> List[List[bool]]:
+        """Column-major walkability for the whole floor (mask[x][y]), matching
+        is_walkable(x, y) with no unlocked doors. One pass over the grid for
+        callers that would otherwise probe every cell; rebuilt on each call
+        so it always reflects the current grid (revealed secrets included)."""
+        return [[cell in _WALKABLE for cell in col] for col in self.grid]
+
+    def cells_of(self, kinds) -> List[Tuple[int, int]]:
+        """Coordinates of every cell whose tile is in `kinds`, column-major
+        (x outer, y inner). One pass over each column list instead of
+        grid[x][y] double indexing per cell."""
+        return [(x, y) for x, col in enumerate(self.grid) for y, cell in enumerate(col) if cell in kinds]
+
+    def is_connected(self, a: Tuple[int, int], b: Tuple[int, int]) -> bool:
+        """True if `b` can be reached from `a` over walkable tiles (locked and
+        secret doors block, as in is_walkable). Floods from `a` and stops as
+        soon as `b` is reached, so callers needn't materialise the component."""
+        w, h = self.config.width, self.config.height
+        if a == b:
+            return True
+        if not (0 <= a[0] < w and 0 <= a[1] < h and 0 <= b[0] < w and 0 <= b[1] < h):
+            return False
+        free = _open_cells(self.grid, _WALKABLE_LUT)
+        target = b[0] * h + b[1]
+        if not free[target]:
+            return False
+        first = a[0] * h + a[1]
+        free[first] = 0
+        queue = [first]
+        for i in queue:
+            x, y = divmod(i, h)
+            for dx, dy in _DIRS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < w and 0 <= ny < h and free[nx * h + ny]:
+                    if nx * h + ny == target:
+                        return True
+                    free[nx * h + ny] = 0
+                    queue.append(nx * h + ny)
+        return False
 
     # ---------------- Metrics ----------------
     def _compute_connectivity_metrics(self):
         if not self.rooms:
             self.metrics["unreachable_rooms"] = 0
             return
-        self.metrics["unreachable_rooms"] = 0 if self._keeps_connectivity(set()) else self._count_unreachable()
-
-    def _count_unreachable(self) -> int:
-        w, h = self.config.width, self.config.height
-        start = self.rooms[0].center
-        q = deque([start])
-        seen = {start}
-        while q:
-            x, y = q.popleft()
-            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
-                if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in seen and self.grid[nx][ny] in _CONNECTED:
-                    seen.add((nx, ny))
-                    q.append((nx, ny))
-        return sum(1 for r in self.rooms if all((ix, iy) not in seen for ix, iy in r.cells()))
+        # One flood answers both "connected?" and "how many rooms are cut off?".
+        reached = _flood_rooms(self.grid, self._room_id, self.rooms, self.rooms[0].center, ())
+        self.metrics["unreachable_rooms"] = reached.count(False)
 
     def _collect_counts(self):
-        counts: Dict[str, int] = {}
+        # Counter.update tallies each column in C instead of a per-cell loop.
+        counts: Counter = Counter()
         w, h = self.config.width, self.config.height
-        for x in range(w):
-            for y in range(h):
-                t = self.grid[x][y]
-                counts[t] = counts.get(t, 0) + 1
+        for col in self.grid:
+            counts.update(col)
         self.metrics.update(
             {
                 "seed": self.seed,
@@ -335,14 +497,17 @@ class Dungeon:
         )
         walkable = sum(counts.get(t, 0) for t in _CONNECTED)
         self.metrics["walkable_coverage"] = walkable / float(w * h)
-        rtc: Dict[str, int] = {}
-        for t in self.room_types:
-            rtc[t] = rtc.get(t, 0) + 1
-        self.metrics["room_type_counts"] = rtc
+        self.metrics["room_type_counts"] = dict(Counter(self.room_types))
 
     # ---------------- Outputs ----------------
+    def _rows(self) -> List[str]:
+        """Row strings (y-major) of the column-major grid. zip(*grid) does the
+        transpose in C, one pass down every column, instead of hopping
+        across all columns for each output cell."""
+        return ["".join(row) for row in zip(*self.grid)]
+
     def to_ascii(self) -> str:
-        return "\n".join("".join(self.grid[x][y] for x in range(self.config.width)) for y in range(self.config.height))
+        return "\n".join(self._rows())
 
     def to_json(self) -> Dict[str, Any]:
         return {
@@ -351,7 +516,7 @@ class Dungeon:
             "height": self.config.height,
             "floor": self.config.floor,
             "num_floors": self.config.num_floors,
-            "grid": ["".join(self.grid[x][y] for x in range(self.config.width)) for y in range(self.config.height)],
+            "grid": self._rows(),
             "metrics": self.metrics,
         }
 
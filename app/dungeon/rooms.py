@@ -7,6 +7,7 @@ afterwards (see connect.fill_maze).
 
 import random
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Tuple
 
 from .config import DungeonConfig
@@ -25,8 +26,19 @@ class Room:
             for iy in range(self.y, self.y + self.h):
                 yield ix, iy
 
-    @property
+    def ring(self):
+        """Cells orthogonally adjacent to the room: its one-cell outline,
+        corners excluded. May extend past the grid edge; callers bound-check."""
+        for ix in range(self.x, self.x + self.w):
+            yield ix, self.y - 1
+            yield ix, self.y + self.h
+        for iy in range(self.y, self.y + self.h):
+            yield self.x - 1, iy
+            yield self.x + self.w, iy
+
+    @cached_property
     def center(self) -> Tuple[int, int]:
+        # Rooms never move once placed, so the tuple is built on first use only.
         return (self.x + self.w // 2, self.y + self.h // 2)
 
 
@@ -38,15 +50,20 @@ def _odd(rng, lo: int, hi: int) -> int:
 def place_rooms(grid, config: DungeonConfig, rng=None):
     """Pack non-overlapping odd-aligned rooms onto the grid.
 
-    Returns (rooms, target_attempted, placed_count).
+    Returns (rooms, target_attempted, placed_count). Without an explicit
+    `rng`, draws come from a private Random seeded with config.seed, never
+    the shared module-level generator.
     """
     if rng is None:
-        rng = random
+        rng = random.Random(config.seed)
     target = config.max_rooms
     attempts = target * 30
     lo = config.min_size | 1
     hi = max(lo, config.max_size if config.max_size % 2 else config.max_size - 1)
     rooms: List[Room] = []
+    # Per-column occupancy (1 = room cell): overlap tests probe only the
+    # candidate's padded footprint instead of scanning every placed room.
+    occupied = [bytearray(config.height) for _ in range(config.width)]
     while len(rooms) < target and attempts > 0:
         attempts -= 1
         w = _odd(rng, lo, hi)
@@ -56,22 +73,21 @@ def place_rooms(grid, config: DungeonConfig, rng=None):
         x = _odd(rng, 1, config.width - w - 1)
         y = _odd(rng, 1, config.height - h - 1)
         new_room = Room(x, y, w, h)
-        if _room_overlaps(new_room, rooms):
+        if _room_overlaps(new_room, occupied):
             continue
-        for ix, iy in new_room.cells():
-            grid[ix][iy] = ROOM
+        for ix in range(x, x + w):
+            grid[ix][y : y + h] = [ROOM] * h
+            occupied[ix][y : y + h] = b"\x01" * h
         rooms.append(new_room)
     return rooms, target, len(rooms)
 
 
-def _room_overlaps(room: Room, existing: List[Room]) -> bool:
+def _room_overlaps(room: Room, occupied: List[bytearray]) -> bool:
+    """True if the room, grown by one wall cell on every side, touches a cell
+    already claimed in `occupied` (per-column bytearrays)."""
     pad = 1  # one wall cell between rooms
-    for r in existing:
-        if (
-            room.x - pad < r.x + r.w
-            and room.x + room.w + pad > r.x
-            and room.y - pad < r.y + r.h
-            and room.y + room.h + pad > r.y
-        ):
+    y0, y1 = room.y - pad, room.y + room.h + pad
+    for col in occupied[room.x - pad : room.x + room.w + pad]:
+        if col.find(1, y0, y1) != -1:
             return True
     return False
@@ -24,6 +24,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from app.dungeon.tiles import DOOR, ROOM, TUNNEL
+
 if TYPE_CHECKING:
     from app.dungeon.dungeon import Dungeon
     from app.models.dungeon_instance import DungeonInstance
@@ -31,6 +33,11 @@ if TYPE_CHECKING:
 
 __all__ = ["SpawnManager", "SpawnConfig", "SpawnBehavior", "SpawnEntry"]
 
+# Tiles a spawn may stand on, and the cardinal steps of a random walk. Built
+# once here rather than per spawn per movement tick.
+_SPAWN_WALKABLE = frozenset((ROOM, TUNNEL, DOOR))
+_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
 
 class SpawnBehavior(Enum):
     """Entity spawn behavior types."""
@@ -477,17 +484,7 @@ class SpawnManager:
 
     def _get_walkable_tiles(self) -> List[Tuple[int, int]]:
         """Get all walkable coordinates from dungeon."""
-        from app.dungeon.tiles import DOOR, ROOM, TUNNEL
-
-        walkable_chars = {ROOM, TUNNEL, DOOR}
-        tiles = []
-
-        for x in range(self.dungeon.config.width):
-            for y in range(self.dungeon.config.height):
-                if self.dungeon.grid[x][y] in walkable_chars:
-                    tiles.append((x, y))
-
-        return tiles
+        return self.dungeon.cells_of(_SPAWN_WALKABLE)
 
     def _calculate_spawn_count(self, walkable_count: int) -> int:
         """Calculate total spawns based on density and limits."""
@@ -685,10 +682,6 @@ class SpawnManager:
 
     def _move_patrol(self, spawn: SpawnEntry):
         """Move a patrolling spawn."""
-        from app.dungeon.tiles import DOOR, ROOM, TUNNEL
-
-        walkable_chars = {ROOM, TUNNEL, DOOR}
-
         # Simple patrol: move randomly within range of spawn point
         distance = abs(spawn.x - spawn.spawn_x) + abs(spawn.y - spawn.spawn_y)
 
@@ -698,15 +691,14 @@ class SpawnManager:
             dy = 1 if spawn.spawn_y > spawn.y else -1 if spawn.spawn_y < spawn.y else 0
         else:
             # Random walk
-            directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-            dx, dy = self.rng.choice(directions)
+            dx, dy = self.rng.choice(_DIRECTIONS)
 
         new_x = spawn.x + dx
         new_y = spawn.y + dy
 
         # Validate movement
         if 0 <= new_x < self.dungeon.config.width and 0 <= new_y < self.dungeon.config.height:
-            if self.dungeon.grid[new_x][new_y] in walkable_chars:
+            if self.dungeon.grid[new_x][new_y] in _SPAWN_WALKABLE:
                 # Check if another spawn is there
                 if not self.get_spawn_at(new_x, new_y):
                     spawn.x = new_x
@@ -714,20 +706,15 @@ class SpawnManager:
 
     def _move_wanderer(self, spawn: SpawnEntry):
         """Move a wandering spawn (random walk)."""
-        from app.dungeon.tiles import DOOR, ROOM, TUNNEL
-
-        walkable_chars = {ROOM, TUNNEL, DOOR}
-
         # Pure random walk
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        dx, dy = self.rng.choice(directions)
+        dx, dy = self.rng.choice(_DIRECTIONS)
 
         new_x = spawn.x + dx
         new_y = spawn.y + dy
 
         # Validate movement
         if 0 <= new_x < self.dungeon.config.width and 0 <= new_y < self.dungeon.config.height:
-            if self.dungeon.grid[new_x][new_y] in walkable_chars:
+            if self.dungeon.grid[new_x][new_y] in _SPAWN_WALKABLE:
                 # Check if another spawn is there
                 if not self.get_spawn_at(new_x, new_y):
                     spawn.x = new_x
@@ -759,16 +746,13 @@ class SpawnManager:
         that axis's destination is blocked, tries the other axis; if
         both are blocked, doesn't move this tick.
         """
-        from app.dungeon.tiles import DOOR, ROOM, TUNNEL
-
-        walkable_chars = {ROOM, TUNNEL, DOOR}
         dx_dist = player_x - spawn.x
         dy_dist = player_y - spawn.y
 
         def step(dx: int, dy: int) -> bool:
             new_x, new_y = spawn.x + dx, spawn.y + dy
             if 0 <= new_x < self.dungeon.config.width and 0 <= new_y < self.dungeon.config.height:
-                if self.dungeon.grid[new_x][new_y] in walkable_chars and not self.get_spawn_at(new_x, new_y):
+                if self.dungeon.grid[new_x][new_y] in _SPAWN_WALKABLE and not self.get_spawn_at(new_x, new_y):
                     spawn.x = new_x
                     spawn.y = new_y
                     return True
@@ -4,8 +4,21 @@ ROOM = "R"
 WALL = "W"
 TUNNEL = "T"
 DOOR = "D"
+SECRET_DOOR = "S"  # wall-like until revealed
+LOCKED_DOOR = "L"  # needs a key (or the final boss kill) to pass
 TELEPORT = "P"  # portal pad (lobby exit in the loot room)
 STAIRS_UP = "<"
 STAIRS_DOWN = ">"
 
-__all__ = ["CAVE", "ROOM", "WALL", "TUNNEL", "DOOR", "TELEPORT", "STAIRS_UP", "STAIRS_DOWN"]
+__all__ = [
+    "CAVE",
+    "ROOM",
+    "WALL",
+    "TUNNEL",
+    "DOOR",
+    "SECRET_DOOR",
+    "LOCKED_DOOR",
+    "TELEPORT",
+    "STAIRS_UP",
+    "STAIRS_DOWN",
+]
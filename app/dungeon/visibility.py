@@ -11,6 +11,8 @@ from __future__ import annotations
 
 from typing import Set, Tuple
 
+_DIRS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
 
 def calculate_visible_tiles(
     grid: list[list[str]], player_x: int, player_y: int, vision_range: int = 12
@@ -62,31 +64,37 @@ def calculate_visible_tiles(
 def _reveal_room(
     grid: list[list[str]], start_x: int, start_y: int, visible: Set[Tuple[int, int]], width: int, height: int
 ):
-    """Flood-fill to reveal all tiles in the current room."""
-    from collections import deque
+    """Flood-fill to reveal all tiles in the current room.
 
-    queue = deque([(start_x, start_y)])
-    checked = {(start_x, start_y)}
+    Cells are packed as x * height + y: `checked` is a flat bytearray and the
+    queue a plain list walked while it grows, so no per-cell tuples are
+    hashed or queued.
+    """
+    start = start_x * height + start_y
+    checked = bytearray(width * height)
+    checked[start] = 1
+    queue = [start]
 
-    while queue:
-        x, y = queue.popleft()
+    for i in queue:
+        x, y = divmod(i, height)
         visible.add((x, y))
 
         # Check all 4 orthogonal neighbors
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+        for dx, dy in _DIRS:
             nx, ny = x + dx, y + dy
 
             if not (0 <= nx < width and 0 <= ny < height):
                 continue
-            if (nx, ny) in checked:
+            j = nx * height + ny
+            if checked[j]:
                 continue
 
-            checked.add((nx, ny))
+            checked[j] = 1
             tile = grid[nx][ny]
 
             # Continue flood fill for room tiles and walls (room boundary)
             if tile == "R":  # ROOM
-                queue.append((nx, ny))
+                queue.append(j)
             elif tile == "W":  # WALL
                 visible.add((nx, ny))  # Make walls visible but don't expand beyond
 
@@ -98,7 +106,7 @@ def _reveal_adjacent_doors(grid: list[list[str]], visible: Set[Tuple[int, int]],
     for x, y in visible:
         if grid[x][y] in ("R", "W"):  # ROOM, WALL
             # Check neighbors for doors
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            for dx, dy in _DIRS:
                 nx, ny = x + dx, y + dy
                 if 0 <= nx < width and 0 <= ny < height:
                     tile = grid[nx][ny]
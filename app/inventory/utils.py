@@ -33,10 +33,59 @@ from __future__ import annotations
 
 import json
 import uuid
+from collections import Counter
 from typing import Any, Dict, List, Tuple
 
+from flask import g, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
 from app.models.models import GameConfig, Item
 
+# slug -> Item.weight cache (1.0 for slugs with no catalogue row, which is what
+# callers fall back to anyway), held on ``flask.g`` so it lives for one app
+# context (one request) only. Gunicorn workers never share it, and nothing
+# cached survives past the request, so admin edits made in another worker or
+# a CLI reseed are picked up by the next request.
+_UNCACHED = object()
+_STALE_FLAG = "item_weights_stale"
+
+
+def _weight_cache() -> Dict[str, Any]:
+    cache = g.get("_item_weights")
+    if cache is None:
+        cache = g._item_weights = {}
+    return cache
+
+
+def clear_item_weight_cache(*_args: Any) -> None:
+    """Forget this app context's cached item weights; safe as an event hook."""
+    if has_app_context():
+        g.pop("_item_weights", None)
+
+
+@event.listens_for(Session, "after_flush")
+def _note_item_writes(session, _flush_context) -> None:
+    # new/dirty/deleted still hold the pre-flush state here.
+    if any(isinstance(o, Item) for objs in (session.new, session.dirty, session.deleted) for o in objs):
+        session.info[_STALE_FLAG] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_after_item_commit(session) -> None:
+    # Cleared at commit, not flush: a read between the two would otherwise
+    # cache the old committed weight after the clear had already happened.
+    if session.info.pop(_STALE_FLAG, False):
+        clear_item_weight_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_after_rollback(session) -> None:
+    # Reads in a rolled-back transaction may have cached weights that never
+    # committed.
+    session.info.pop(_STALE_FLAG, None)
+    clear_item_weight_cache()
+
 
 def load_inventory(raw_json: str | None) -> List[Dict[str, Any]]:
     """Deserialize inventory JSON into canonical list of {slug, qty} dicts.
@@ -51,12 +100,8 @@ def load_inventory(raw_json: str | None) -> List[Dict[str, Any]]:
     except Exception:
         return []
     if isinstance(data, list) and (not data or isinstance(data[0], str)):
-        # Legacy list of slugs -> aggregate
-        agg = {}
-        for slug in data:
-            if not isinstance(slug, str):
-                continue
-            agg[slug] = agg.get(slug, 0) + 1
+        # Legacy list of slugs -> aggregate (Counter keeps first-seen order)
+        agg = Counter(slug for slug in data if isinstance(slug, str))
         return [{"slug": s, "qty": q} for s, q in agg.items()]
     # Already canonical? Validate shape. Two entry kinds coexist in the list:
     #   - stack entries: {"slug": str, "qty": int}
@@ -129,11 +174,11 @@ def add_gear_value(inv: List[Dict[str, Any]], value: Any) -> List[Dict[str, Any]
 
 def remove_one(inv: List[Dict[str, Any]], slug: str) -> bool:
     """Remove a single instance of slug if present; return True if removed."""
-    for obj in inv:
+    for i, obj in enumerate(inv):
         if obj.get("slug") == slug:
             obj["qty"] -= 1
             if obj["qty"] <= 0:
-                inv.remove(obj)
+                del inv[i]  # by position: inv.remove would rescan comparing dicts
             return True
     return False
 
@@ -148,9 +193,9 @@ def find_instance(inv: List[Dict[str, Any]], uid: str) -> Dict[str, Any] | None:
 
 def remove_instance(inv: List[Dict[str, Any]], uid: str) -> bool:
     """Remove a procedural gear instance by uid; return True if removed."""
-    for obj in inv:
+    for i, obj in enumerate(inv):
         if obj.get("uid") == uid:
-            inv.remove(obj)
+            del inv[i]
             return True
     return False
 
@@ -184,26 +229,45 @@ def compute_capacity(str_score: int, cfg: dict) -> int:
     return base + max(0, int(str_score)) * per
 
 
-def compute_weight(inv: List[Dict[str, Any]]) -> float:
-    if not inv:
-        return 0.0
-    slugs = [o["slug"] for o in inv if o.get("slug")]
-    items = Item.query.filter(Item.slug.in_(slugs)).all() if slugs else []
-    weight_by_slug = {i.slug: (getattr(i, "weight", 1.0) or 1.0) for i in items}
+def _item_weights(slugs: List[str]) -> Dict[str, Any]:
+    """Raw Item.weight per slug; only slugs not yet cached are queried, together."""
+    cache = _weight_cache()
+    weights: Dict[str, Any] = {}
+    missing = set()
+    for s in slugs:
+        w = cache.get(s, _UNCACHED)
+        if w is _UNCACHED:
+            missing.add(s)
+        else:
+            weights[s] = w
+    if missing:
+        found = {i.slug: getattr(i, "weight", 1.0) for i in Item.query.filter(Item.slug.in_(missing)).all()}
+        for s in missing:
+            weights[s] = cache[s] = found.get(s, 1.0)
+    return weights
+
+
+def _carried_weight(inv: List[Dict[str, Any]], weights: Dict[str, Any]) -> float:
+    """Total bag weight given prefetched ``_item_weights``; no database access."""
     total = 0.0
     for obj in inv:
         if obj.get("uid"):
             # Procedural gear instance: use its own weight if present, else 1.0
             total += float(obj.get("weight", 1.0) or 1.0)
         else:
-            total += weight_by_slug.get(obj.get("slug"), 1.0) * obj.get("qty", 1)
+            total += (weights.get(obj.get("slug")) or 1.0) * obj.get("qty", 1)
     return float(total)
 
 
-def encumbrance_state(str_score: int, inv: List[Dict[str, Any]]) -> dict:
-    cfg = fetch_encumbrance_config()
-    cap = compute_capacity(str_score, cfg)
-    w = compute_weight(inv)
+def compute_weight(inv: List[Dict[str, Any]]) -> float:
+    if not inv:
+        return 0.0
+    slugs = [o["slug"] for o in inv if o.get("slug")]
+    return _carried_weight(inv, _item_weights(slugs))
+
+
+def _classify(w: float, cap: int, cfg: dict) -> dict:
+    """Encumbrance state for a carried weight against a capacity."""
     warn_pct = float(cfg.get("warn_pct", 1.0))
     hard_pct = float(cfg.get("hard_cap_pct", 1.10))
     status = "normal"
@@ -224,29 +288,37 @@ def encumbrance_state(str_score: int, inv: List[Dict[str, Any]]) -> dict:
     }
 
 
+def encumbrance_state(str_score: int, inv: List[Dict[str, Any]], cfg: dict | None = None) -> dict:
+    """Encumbrance state of ``inv``; pass ``cfg`` when already fetched."""
+    if cfg is None:
+        cfg = fetch_encumbrance_config()
+    return _classify(compute_weight(inv), compute_capacity(str_score, cfg), cfg)
+
+
 def can_add_item(str_score: int, inv: List[Dict[str, Any]], slug: str, qty: int = 1) -> Tuple[bool, dict]:
     """Predict whether adding qty of slug would exceed hard cap.
 
     Returns (allowed, resulting_state) where resulting_state is encumbrance state AFTER
     the hypothetical addition (if allowed) or current state if not allowed.
+
+    The config row and the item weights (bag slugs plus ``slug``, from the
+    weight cache) are fetched once and shared by the cap check and the
+    returned state.
     """
-    # Quick evaluation using current state and projected weight delta
     cfg = fetch_encumbrance_config()
     cap = compute_capacity(str_score, cfg)
     hard_pct = float(cfg.get("hard_cap_pct", 1.10))
-    # Pull item weight
-    item = Item.query.filter_by(slug=slug).first()
-    item_w = getattr(item, "weight", 1.0) if item else 1.0
-    cur_weight = compute_weight(inv)
+    weights = _item_weights([o["slug"] for o in inv if o.get("slug")] + [slug])
+    item_w = weights.get(slug, 1.0)
+    cur_weight = _carried_weight(inv, weights)
     new_weight = cur_weight + item_w * qty
     if new_weight > cap * hard_pct:
         # Not allowed; report current state
-        return False, encumbrance_state(str_score, inv)
-    # Allowed; compute new state
-    # Temporarily adjust inventory for state computation
+        return False, _classify(cur_weight, cap, cfg)
+    # Allowed; weigh a stacked copy so the state matches compute_weight exactly
     temp_inv = [dict(o) for o in inv]
     add_item(temp_inv, slug, qty)
-    return True, encumbrance_state(str_score, temp_inv)
+    return True, _classify(_carried_weight(temp_inv, weights), cap, cfg)
 
 
 def apply_encumbrance_penalty(base_stats: dict, enc_state: dict) -> dict:
@@ -13,9 +13,13 @@ from __future__ import annotations
 import json
 import random
 import uuid
+from bisect import bisect_left
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import List, Sequence
 
+from sqlalchemy import insert
+
 from app import db
 from app.models.loot import DungeonLoot
 from app.models.models import GameConfig, Item
@@ -44,20 +48,11 @@ class LootConfig:
 def _choose_items(item_pool: Sequence[Item], count: int, rng: random.Random) -> List[Item]:
     if not item_pool:
         return []
-    # Weighted by rarity
-    weights = [RARITY_WEIGHTS.get(it.rarity, 1) for it in item_pool]
-    total = sum(weights)
-    # Convert to selection list; for performance we just do repeated roulette wheel
-    chosen = []
-    for _ in range(count):
-        r = rng.randint(1, total)
-        upto = 0
-        for it, w in zip(item_pool, weights):
-            upto += w
-            if r <= upto:
-                chosen.append(it)
-                break
-    return chosen
+    # Weighted by rarity: one randint per pick, located by bisecting the
+    # running weight totals instead of re-walking the pool each time.
+    cum = list(accumulate(RARITY_WEIGHTS.get(it.rarity, 1) for it in item_pool))
+    total = cum[-1]
+    return [item_pool[bisect_left(cum, rng.randint(1, total))] for _ in range(count)]
 
 
 def _level_window(avg_level: int) -> tuple[int, int]:
@@ -176,24 +171,26 @@ def generate_loot_for_seed(cfg: LootConfig, walkable_tiles: Sequence[tuple[int,
     # Select items for placements
     chosen_items = _choose_items(candidate_items, len(chosen_tiles), rng)
 
-    created = 0
+    # existing_coords was loaded above and grows as rows are planned, so no
+    # per-placement SELECT is needed; the rows then go out in one executemany.
+    rows = []
     for (x, y, z), item in zip(chosen_tiles, chosen_items):
-        # Re-check existence (race/idempotence safety)
-        if DungeonLoot.query.filter_by(seed=cfg.seed, x=x, y=y, z=z).first():
+        if (x, y, z) in existing_coords:
             continue
+        existing_coords.add((x, y, z))
 
         if rng.random() < gear_chance:
             rarity = _roll_floor_rarity(rng, rarity_weights)
             level = rng.randint(lo, hi)
             inst = generate_item(level, rarity=rarity, rng=rng)
-            db.session.add(DungeonLoot(seed=cfg.seed, x=x, y=y, z=z, item_id=None, instance_json=json.dumps(inst)))
+            rows.append({"seed": cfg.seed, "x": x, "y": y, "z": z, "item_id": None, "instance_json": json.dumps(inst)})
         else:
-            db.session.add(DungeonLoot(seed=cfg.seed, x=x, y=y, z=z, item_id=item.id))
+            rows.append({"seed": cfg.seed, "x": x, "y": y, "z": z, "item_id": item.id, "instance_json": None})
 
-        created += 1
-    if created:
+    if rows:
+        db.session.execute(insert(DungeonLoot), rows)
         db.session.commit()
-    return created
+    return len(rows)
 
 
 # ---------------------------------------------------------------------------
@@ -11,6 +11,7 @@ and the adventure UI. All routes require authentication.
 """
 
 import json
+import os
 import random
 import threading
 from functools import wraps
@@ -98,8 +99,7 @@ bp_dungeon = Blueprint("dungeon", __name__)
 
 
 def get_cached_dungeon(seed: int, size_tuple: tuple[int, int, int], floor: int = 0, num_floors: int = 1):
-    import os
-
+    # Read per call, not cached at import: tooling flips this at runtime.
     if os.environ.get("DUNGEON_DISABLE_CACHE") == "1":
         return Dungeon(seed=seed, size=size_tuple, floor=floor, num_floors=num_floors)
     key = (seed, size_tuple, floor, num_floors)
@@ -124,6 +124,8 @@ def get_cached_dungeon(seed: int, size_tuple: tuple[int, int, int], floor: int =
 
 
 MAP_SIZE = 75
+# Orthogonal steps for the entity-repair search, in its original probe order.
+_NEIGHBOR_STEPS = ((-1, 0), (1, 0), (0, -1), (0, 1))
 
 
 def num_floors_for_tier(tier: int) -> int:
@@ -459,10 +461,7 @@ def dungeon_map():
             z = dungeon.config.floor
             floor_key = floor_seed(instance.seed, z)
             # Loot generation (idempotent, per floor via floor_key). Collect walkable tiles.
-            walkable_chars = {ROOM, TUNNEL, DOOR}
-            walkables = [
-                (x, y) for x in range(MAP_SIZE) for y in range(MAP_SIZE) if dungeon.grid[x][y] in walkable_chars
-            ]
+            walkables = dungeon.cells_of(frozenset((ROOM, TUNNEL, DOOR)))
             # Floor loot rides the same curve as the monsters on it, so going
             # deeper is rewarded as well as more dangerous.
             try:
@@ -500,23 +499,11 @@ def dungeon_map():
                 and 0 <= pz < dungeon.config.num_floors
                 and dungeon.grid[px][py] in walkable_chars
             )
-            # Flood fill from entrance to get all connected tiles
-            connected = set()
-            if entrance:
-                from collections import deque
-
-                queue = deque([(entrance[0], entrance[1])])
-                connected.add((entrance[0], entrance[1]))
-                while queue:
-                    cx, cy = queue.popleft()
-                    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                        nx, ny = cx + dx, cy + dy
-                        if 0 <= nx < MAP_SIZE and 0 <= ny < MAP_SIZE and (nx, ny) not in connected:
-                            if dungeon.grid[nx][ny] in walkable_chars:
-                                connected.add((nx, ny))
-                                queue.append((nx, ny))
-            # If not valid, not connected, or at (0,0,0), move to entrance
-            if (not is_valid or (px, py) not in connected or player_pos == [0, 0, 0]) and entrance:
+            # If not valid, not connected to the entrance, or at (0,0,0), move to
+            # entrance. The connectivity flood stops as soon as it reaches the player.
+            if entrance and (
+                not is_valid or player_pos == [0, 0, 0] or not dungeon.is_connected(entrance[:2], (px, py))
+            ):
                 player_pos = list(entrance)
                 # Also update DB so movement works
                 instance.pos_x, instance.pos_y, instance.pos_z = entrance
@@ -563,18 +550,15 @@ def dungeon_map():
 
                 We cap search radius defensively at 12 to avoid pathological full-map scans.
                 """
-                from collections import deque as _deque
-
                 if _is_walkable_tile(tx, ty) and (tx, ty) not in occupied:
                     return (tx, ty)
                 seen = {(tx, ty)}
-                q = _deque([(tx, ty, 0)])
+                q = [(tx, ty, 0)]
                 LIMIT = 12
-                while q:
-                    cx, cy, dist = q.popleft()
+                for cx, cy, dist in q:  # list grown while iterated: FIFO without popleft
                     if dist > LIMIT:
                         break
-                    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                    for dx, dy in _NEIGHBOR_STEPS:
                         nx, ny = cx + dx, cy + dy
                         if (nx, ny) in seen:
                             continue
@@ -30,6 +30,7 @@ from sqlalchemy import text
 
 from app import app as flask_app
 from app import db
+from app.inventory.utils import clear_item_weight_cache
 
 SQL_DIR = Path(__file__).resolve().parent.parent / "sql"
 
@@ -118,6 +119,8 @@ def clear_item_categories() -> int:
     stmt = text("DELETE FROM item WHERE type IN (%s)" % in_clause)
     result = db.session.execute(stmt, params)
     db.session.commit()
+    # Text DELETEs flush no Item objects, so the commit hook won't clear this.
+    clear_item_weight_cache()
     return int(result.rowcount or 0)
 
 
@@ -221,6 +224,8 @@ def execute_sql_file(path: Path) -> None:
         raw_conn.commit()
     finally:  # pragma: no cover - safety cleanup
         raw_conn.close()
+    # Raw SQL bypasses the commit hook that clears this context's weight cache.
+    clear_item_weight_cache()
 
 
 def reseed_items(clear_first: bool = False, verbose: bool = True) -> None:
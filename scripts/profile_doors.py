@@ -1,7 +1,7 @@
 import time
 from statistics import mean, pstdev
 
-from app.dungeon import Dungeon
+from app.dungeon import Dungeon, DungeonConfig
 
 SEEDS = [11, 222, 3333, 4444, 55555, 67890, 72223, 88888, 99999, 123456]
 SIZE = (60, 60, 1)
@@ -11,11 +11,11 @@ def run():
     runtimes = []
     for s in SEEDS:
         t0 = time.perf_counter()
-        d = Dungeon(seed=s, size=SIZE)
+        d = Dungeon(DungeonConfig(width=SIZE[0], height=SIZE[1], seed=s, time_phases=True))
         t1 = time.perf_counter()
         rt = (t1 - t0) * 1000
-        doors_summary = d.metrics.get("doors", {}) if d.enable_metrics else {}
-        print(f"seed={s} ms={rt:.1f} doors={doors_summary}")
+        doors = d.metrics.get("tiles_door", 0)
+        print(f"seed={s} ms={rt:.1f} doors={doors} phases={d.metrics['phase_ms']}")
         runtimes.append(rt)
     print("\nSummary:")
     print(
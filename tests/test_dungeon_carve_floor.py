@@ -14,7 +14,7 @@ from app.dungeon import Dungeon
 from app.dungeon.config import DungeonConfig
 from app.dungeon.connect import connect_regions, cull_dead_ends, derive_walls, fill_maze
 from app.dungeon.dungeon import LOCKED_DOOR, SECRET_DOOR, floor_seed
-from app.dungeon.rooms import place_rooms
+from app.dungeon.rooms import Room, place_rooms
 from app.dungeon.tiles import CAVE, DOOR, ROOM, STAIRS_DOWN, STAIRS_UP, TELEPORT, TUNNEL
 
 WALKABLE = {ROOM, TUNNEL, DOOR, TELEPORT, STAIRS_UP, STAIRS_DOWN, LOCKED_DOOR}
@@ -43,6 +43,15 @@ def test_rooms_do_not_overlap_and_stay_in_bounds():
             assert sep_x >= 1 or sep_y >= 1  # at least one wall cell between rooms
 
 
+def test_room_ring_is_outer_neighbourhood():
+    room = Room(3, 5, 5, 7)
+    cells = set(room.cells())
+    expected = {(x + dx, y + dy) for x, y in cells for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))} - cells
+    ring = list(room.ring())
+    assert len(ring) == len(set(ring)) == 2 * (room.w + room.h)
+    assert set(ring) == expected
+
+
 # ---------------- maze + connectivity primitives ----------------
 
 
@@ -55,6 +55,40 @@ def test_start_room_center_walkable():
     assert d.is_walkable(cx, cy), "Start room center not walkable"
 
 
+def test_walkable_mask_matches_is_walkable():
+    d = gen(444)
+    mask = d.walkable_mask()
+    assert len(mask) == d.config.width and len(mask[0]) == d.config.height
+    for x in range(d.config.width):
+        for y in range(d.config.height):
+            assert mask[x][y] == d.is_walkable(x, y), f"Mask disagrees with is_walkable at {(x, y)}"
+
+
+def test_is_connected_matches_flood():
+    from collections import deque
+
+    d = gen(555)
+    w, h = d.config.width, d.config.height
+    start = d.entry_point
+    seen = {start}
+    q = deque([start])
+    while q:
+        x, y = q.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (nx, ny) not in seen and d.is_walkable(nx, ny):
+                seen.add((nx, ny))
+                q.append((nx, ny))
+    for x in range(0, w, 3):
+        for y in range(0, h, 3):
+            assert d.is_connected(start, (x, y)) == ((x, y) in seen), f"is_connected wrong at {(x, y)}"
+
+
+def test_door_counts_match_room_doors():
+    for s in (11, 12, 13):
+        d = gen(s)
+        assert d._door_counts() == [len(d._room_doors(r)) for r in d.rooms]
+
+
 def test_secret_and_locked_door_behavior():
     # Sample a modest seed window; door variants are probabilistic and may be absent in small grids.
     seeds = range(400, 415)
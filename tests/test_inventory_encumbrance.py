@@ -143,3 +143,44 @@ def test_character_state_exposes_stat_points_and_xp_thresholds(client):
     assert match["stat_points"] == 4
     assert match["xp_for_current_level"] == expected_current
     assert match["xp_for_next_level"] == expected_next
+
+
+@pytest.mark.db_isolation
+def test_item_weight_cache_follows_weight_edits():
+    from app.inventory.utils import compute_weight
+
+    with app.app_context():
+        sword = ensure_item("short-sword")
+        sword.weight = 2.0
+        db.session.commit()
+        bag = [{"slug": "short-sword", "qty": 2}, {"slug": "no-such-item", "qty": 1}]
+        assert compute_weight(bag) == 5.0
+        sword.weight = 3.0
+        db.session.commit()
+        assert compute_weight(bag) == 7.0
+
+
+@pytest.mark.db_isolation
+def test_item_weight_cache_cleared_at_commit_not_flush():
+    from app.inventory.utils import _weight_cache, compute_weight
+
+    with app.app_context():
+        sword = ensure_item("short-sword")
+        sword.weight = 2.0
+        db.session.commit()
+        bag = [{"slug": "short-sword", "qty": 2}]
+        sword.weight = 3.0
+        db.session.flush()
+        # A reader between flush and commit still sees the old committed row.
+        _weight_cache()["short-sword"] = 2.0
+        db.session.commit()
+        assert compute_weight(bag) == 6.0
+
+
+def test_item_weight_cache_is_per_app_context():
+    from app.inventory.utils import _weight_cache
+
+    with app.app_context():
+        _weight_cache()["short-sword"] = 99.0
+    with app.app_context():
+        assert "short-sword" not in _weight_cache()